@@ -1,6 +1,25 @@
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser
+    orjson = None
+
+
+CONFIG_PATH = Path(__file__).parent.parent.parent.parent / "config.json"
+
+# Raw config.json contents, read once per process and reused on reload
+_CONFIG_BYTES: Optional[bytes] = None
+
+
+def _read_config_bytes() -> bytes:
+    """Read config.json once and cache its raw bytes"""
+    global _CONFIG_BYTES
+    if _CONFIG_BYTES is None:
+        _CONFIG_BYTES = CONFIG_PATH.read_bytes()
+    return _CONFIG_BYTES
 
 
 class Settings:
@@ -9,13 +28,17 @@ class Settings:
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from config.json"""
-        config_path = Path(__file__).parent.parent.parent.parent / "config.json"
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            data = _read_config_bytes()
         except FileNotFoundError:
             return {}
-        except json.JSONDecodeError:
+
+        try:
+            if orjson is not None:
+                return orjson.loads(data)
+            return json.loads(data)
+        except ValueError:
+            # orjson.JSONDecodeError and json.JSONDecodeError are both ValueErrors
             raise ValueError("Invalid JSON in config.json")
 
     @property
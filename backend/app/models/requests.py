@@ -1,10 +1,14 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
 class PlayRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     speed: Optional[float] = None
 
 
 class SpeedRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     speed: float
\ No newline at end of file
@@ -1,4 +1,9 @@
-from fastapi import APIRouter, HTTPException
+from typing import Any, Callable, Optional, Type, TypeVar
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 from app.models.requests import PlayRequest, SpeedRequest
 from app.services.video_service import VideoService
 
@@ -6,44 +11,99 @@ router = APIRouter(tags=["video"])
 
 video_service = VideoService()
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Body used when /play is called without one; the model is frozen, so the
+# instance can be shared across requests
+_DEFAULT_PLAY_REQUEST = PlayRequest()
+
+
+async def _parse_body(request: Request, model: Type[ModelT], default: Optional[ModelT] = None) -> ModelT:
+    """Validate the raw JSON body in a single pass with Pydantic's JSON parser"""
+    body = await request.body()
+    if not body:
+        if default is not None:
+            return default
+        # Same error FastAPI reports for a missing required body
+        error = ValidationError.from_exception_data(
+            "Field required", [{"type": "missing", "loc": ("body",), "input": None}]
+        ).errors()[0]
+        raise RequestValidationError([error])
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        # Match FastAPI's own body errors, whose locations start with "body"
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+
+
+def _json_body(model: Type[BaseModel], required: bool = True) -> dict:
+    """OpenAPI request body for handlers that parse the raw request themselves"""
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+            "required": required,
+        }
+    }
+
+
+def _call_locked(func: Callable[..., dict], *args: Any) -> dict:
+    """Call a service method while holding the service lock"""
+    with video_service.lock:
+        return func(*args)
+
+
+async def _locked(func: Callable[..., dict], *args: Any) -> dict:
+    """Run a state-changing service call off the event loop, one at a time"""
+    return await run_in_threadpool(_call_locked, func, *args)
+
 
 @router.post("/load_video")
 async def load_video(video_path: str):
     """Load a video file"""
-    return video_service.load_video(video_path)
+    return await _locked(video_service.load_video, video_path)
 
 
-@router.post("/play")
-async def play_video(request: PlayRequest = PlayRequest()):
+@router.post("/play", openapi_extra=_json_body(PlayRequest, required=False))
+async def play_video(request: Request):
     """Play video with optional speed parameter"""
-    return video_service.play_video(request.speed)
+    body = await _parse_body(request, PlayRequest, _DEFAULT_PLAY_REQUEST)
+    return await _locked(video_service.play_video, body.speed)
 
 
 @router.post("/pause")
 async def pause_video():
     """Pause video playback"""
-    return video_service.pause_video()
+    return await _locked(video_service.pause_video)
 
 
 @router.post("/stop")
 async def stop_video():
     """Stop video playback"""
-    return video_service.stop_video()
+    return await _locked(video_service.stop_video)
 
 
 @router.post("/reset")
 async def reset_video():
     """Reset video to beginning"""
-    return video_service.reset_video()
+    return await _locked(video_service.reset_video)
+
+
+@router.post("/seek/{frame}")
+async def seek_video(frame: int):
+    """Seek video to a frame"""
+    return await _locked(video_service.seek_video, frame)
 
 
-@router.post("/set_speed")
-async def set_speed(request: SpeedRequest):
+@router.post("/set_speed", openapi_extra=_json_body(SpeedRequest))
+async def set_speed(request: Request):
     """Set playback speed"""
-    return video_service.set_speed(request.speed)
+    body = await _parse_body(request, SpeedRequest)
+    return await _locked(video_service.set_speed, body.speed)
 
 
-@router.get("/status")
+@router.get("/status", response_model=None)
 async def get_status():
     """Get current player status"""
     return video_service.get_status()
\ No newline at end of file
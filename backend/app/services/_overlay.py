@@ -0,0 +1,157 @@
+"""
+Per-frame overlay and scheduling kernels for MediaPlayer.
+
+The functions in this module run once per displayed frame. When Numba is
+installed the array kernels are compiled to machine code; otherwise
+equivalent plain Python/NumPy implementations are used. compute_schedule
+stays plain Python since Numba's dispatch overhead exceeds its arithmetic.
+"""
+
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+# Characters of the MM:SS:mmm timestamp, indexed by glyph id
+TIMESTAMP_CHARS = "0123456789:"
+COLON = 10
+
+
+def compute_schedule(current_frame: int, schedule_base: int, fps: float,
+                     speed: float, schedule_start: float) -> Tuple[float, float]:
+    """
+    Compute the display deadline of a frame.
+
+    Args:
+        current_frame (int): Index of the frame to schedule
+        schedule_base (int): Frame index the schedule was anchored at
+        fps (float): Video frame rate
+        speed (float): Playback speed multiplier
+        schedule_start (float): Monotonic time the schedule was anchored at
+
+    Returns:
+        Tuple[float, float]: Deadline in monotonic seconds and frame period
+    """
+    period = 1.0 / (fps * speed)
+    return schedule_start + (current_frame - schedule_base) * period, period
+
+
+def timestamp_glyphs(current_frame: int, ms_per_frame: float) -> np.ndarray:
+    """
+    Compute the glyph ids of a MM:SS:mmm timestamp.
+
+    Args:
+        current_frame (int): Current frame index
+        ms_per_frame (float): Duration of one frame in milliseconds
+
+    Returns:
+        np.ndarray: Nine glyph ids indexing TIMESTAMP_CHARS
+    """
+    total_ms = int(current_frame * ms_per_frame)
+    seconds = total_ms // 1000
+    milliseconds = total_ms % 1000
+    minutes = (seconds // 60) % 100
+    seconds = seconds % 60
+
+    glyphs = np.empty(9, dtype=np.uint8)
+    glyphs[0] = minutes // 10
+    glyphs[1] = minutes % 10
+    glyphs[2] = COLON
+    glyphs[3] = seconds // 10
+    glyphs[4] = seconds % 10
+    glyphs[5] = COLON
+    glyphs[6] = milliseconds // 100
+    glyphs[7] = (milliseconds // 10) % 10
+    glyphs[8] = milliseconds % 10
+    return glyphs
+
+
+def _blit_patches_numpy(frame: np.ndarray, patches: np.ndarray, masks: np.ndarray,
+                        indices: np.ndarray, offsets: np.ndarray, y: int) -> None:
+    """
+    Copy the masked pixels of image patches into a frame in place.
+
+    Args:
+        frame (np.ndarray): BGR frame to draw into
+        patches (np.ndarray): Patch images, shape (n, h, w, 3)
+        masks (np.ndarray): Boolean masks of drawn pixels, shape (n, h, w)
+        indices (np.ndarray): Patch to draw at each position
+        offsets (np.ndarray): Left x coordinate of each position
+        y (int): Top y coordinate of all positions
+    """
+    height = min(patches.shape[1], frame.shape[0] - y)
+    if height <= 0:
+        return
+    for i in range(indices.shape[0]):
+        x = offsets[i]
+        width = min(patches.shape[2], frame.shape[1] - x)
+        if width <= 0:
+            continue
+        mask = masks[indices[i], :height, :width]
+        frame[y:y + height, x:x + width][mask] = patches[indices[i], :height, :width][mask]
+
+
+def _blit_patches_loops(frame, patches, masks, indices, offsets, y):
+    """Loop form of _blit_patches_numpy for Numba."""
+    height = min(patches.shape[1], frame.shape[0] - y)
+    for i in range(indices.shape[0]):
+        g = indices[i]
+        x = offsets[i]
+        width = min(patches.shape[2], frame.shape[1] - x)
+        for r in range(height):
+            for c in range(width):
+                if masks[g, r, c]:
+                    for ch in range(3):
+                        frame[y + r, x + c, ch] = patches[g, r, c, ch]
+
+
+if HAVE_NUMBA:
+    timestamp_glyphs = njit(cache=True)(timestamp_glyphs)
+    blit_patches = njit(cache=True)(_blit_patches_loops)
+    # Compile now, with the argument types MediaPlayer passes, rather than
+    # on the first frames of the first playback
+    timestamp_glyphs(0, 1.0)
+    blit_patches(
+        np.zeros((1, 1, 3), dtype=np.uint8), np.zeros((1, 1, 1, 3), dtype=np.uint8),
+        np.zeros((1, 1, 1), dtype=np.bool_), np.zeros(1, dtype=np.uint8),
+        np.zeros(1, dtype=np.int64), 0
+    )
+else:
+    blit_patches = _blit_patches_numpy
+
+
+def render_text_patches(chars: str, font: int, scale: float, color: Tuple[int, int, int],
+                        thickness: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Rasterize each character of a string into its own patch.
+
+    Args:
+        chars (str): Characters to render, one patch each
+        font (int): OpenCV font face
+        scale (float): Font scale
+        color (Tuple[int, int, int]): BGR text color
+        thickness (int): Stroke thickness
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, int]: Patches, their pixel
+        masks, the advance width of each character, and the text height above
+        the baseline
+    """
+    sizes = [cv2.getTextSize(ch, font, scale, thickness) for ch in chars]
+    height = max(size[0][1] for size in sizes)
+    depth = max(size[1] for size in sizes) + thickness
+    widths = np.array([size[0][0] for size in sizes], dtype=np.int64)
+
+    patches = np.zeros((len(chars), height + depth, int(widths.max()), 3), dtype=np.uint8)
+    for i, ch in enumerate(chars):
+        cv2.putText(patches[i], ch, (0, height), font, scale, color, thickness, cv2.LINE_AA)
+    # getTextSize widths include the stroke thickness once per call; putText
+    # advances between characters without it
+    return patches, patches.any(axis=3), widths - thickness, height
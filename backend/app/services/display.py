@@ -0,0 +1,143 @@
+"""
+DisplayPump class for showing video frames from the main thread.
+
+Many OpenCV GUI backends (Cocoa, some X11 builds) only work reliably when
+cv2.imshow and cv2.waitKey are called from the main thread. This module
+provides a DisplayPump that playback threads post frames to, while the main
+thread runs the GUI loop.
+"""
+
+import queue
+import threading
+
+import cv2
+
+
+class DisplayPump:
+    """
+    Hands frames from playback threads to a GUI loop on the main thread.
+
+    While run() is active on the main thread, frames are queued and drawn
+    there. If the pump was never started (e.g. when the app is served by an
+    external uvicorn process), calls fall back to drawing directly on the
+    calling thread. Once run() has returned, calls are ignored so shutdown
+    code never touches the GUI off the main thread.
+    """
+
+    WINDOW_NAME = 'Video Player'
+
+    # Keys that stop playback: 'q' or ESC
+    QUIT_KEYS = (ord('q'), 27)
+
+    # How long the GUI loop waits for a frame before servicing the window
+    POLL_INTERVAL = 0.01
+
+    def __init__(self) -> None:
+        """Initialize an idle display pump."""
+        # Holds only the newest frame; None asks the loop to close the window
+        self._queue: queue.Queue = queue.Queue(maxsize=1)
+        self._running = False
+        self._finished = False
+        self._stop_event = threading.Event()
+        self._quit_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Whether the GUI loop is active on the main thread."""
+        return self._running
+
+    def show(self, frame) -> None:
+        """
+        Display a frame, replacing any frame not yet drawn.
+
+        Args:
+            frame: The frame to display
+        """
+        if self._finished:
+            return
+        if not self._running:
+            cv2.imshow(self.WINDOW_NAME, frame)
+            return
+        self._post(frame)
+
+    def close_window(self) -> None:
+        """Close the video window."""
+        if self._finished:
+            return
+        if not self._running:
+            cv2.destroyAllWindows()
+            return
+        self._post(None)
+
+    def poll_quit(self) -> bool:
+        """
+        Check whether a quit key was pressed since the last call.
+
+        Returns:
+            bool: True if ESC or 'q' was pressed
+        """
+        if self._finished:
+            return False
+        if not self._running:
+            key = cv2.waitKey(1) & 0xFF
+            return key in self.QUIT_KEYS
+
+        if self._quit_event.is_set():
+            self._quit_event.clear()
+            return True
+        return False
+
+    def clear_quit(self) -> None:
+        """Forget quit keys pressed while nothing was playing."""
+        self._quit_event.clear()
+
+    def _post(self, item) -> None:
+        """
+        Queue an item for the GUI loop, dropping a stale one if needed.
+
+        Args:
+            item: A frame, or None to close the window
+        """
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def run(self) -> None:
+        """
+        Run the GUI loop until stop() is called.
+
+        Must be called from the main thread.
+        """
+        self._stop_event.clear()
+        self._running = True
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    item = self._queue.get(timeout=self.POLL_INTERVAL)
+                    if item is None:
+                        cv2.destroyAllWindows()
+                    else:
+                        cv2.imshow(self.WINDOW_NAME, item)
+                except queue.Empty:
+                    pass
+
+                key = cv2.waitKey(1) & 0xFF
+                if key in self.QUIT_KEYS:
+                    self._quit_event.set()
+        finally:
+            self._finished = True
+            self._running = False
+            cv2.destroyAllWindows()
+
+    def stop(self) -> None:
+        """Ask the GUI loop to exit."""
+        self._stop_event.set()
+
+
+display_pump = DisplayPump()
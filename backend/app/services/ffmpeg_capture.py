@@ -0,0 +1,293 @@
+"""
+FFmpeg subprocess capture with hardware-accelerated decoding.
+
+This module provides an FFmpegCapture class that decodes video through an
+ffmpeg child process (e.g. with CUDA/NVDEC or VAAPI) and exposes the subset
+of the cv2.VideoCapture interface used by MediaPlayer.
+"""
+
+import json
+import shutil
+import subprocess
+import tempfile
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+# ffmpeg input options for each supported hardware decoder
+HWACCEL_OPTIONS = {
+    "cuda": ["-hwaccel", "cuda"],
+    "vaapi": ["-hwaccel", "vaapi"],
+}
+
+
+@lru_cache(maxsize=32)
+def probe_video(video_path: str) -> Dict[str, Any]:
+    """
+    Probe the first video stream of a file with ffprobe.
+
+    Results are cached per path since stream properties don't change.
+
+    Args:
+        video_path (str): Path to the video file
+
+    Returns:
+        Dict[str, Any]: Width, height, fps and frame count of the stream
+
+    Raises:
+        ValueError: If ffprobe is unavailable or the file has no video stream
+    """
+    ffprobe = shutil.which("ffprobe")
+    if ffprobe is None:
+        raise ValueError("ffprobe not found")
+
+    try:
+        result = subprocess.run(
+            [
+                ffprobe, "-v", "error", "-select_streams", "v:0",
+                "-show_entries", "stream=width,height,r_frame_rate,nb_frames",
+                "-of", "json", video_path,
+            ],
+            capture_output=True,
+        )
+    except OSError as e:
+        raise ValueError(f"Could not run ffprobe: {e}")
+
+    streams = json.loads(result.stdout).get("streams") if result.returncode == 0 else None
+    if not streams:
+        raise ValueError(f"Could not probe video file: {video_path}")
+
+    stream = streams[0]
+    try:
+        num, _, den = stream.get("r_frame_rate", "0/1").partition("/")
+        den_value = float(den or 1)
+        fps = float(num) / den_value if den_value else 0.0
+        nb_frames = stream.get("nb_frames", "0")
+        return {
+            "width": int(stream["width"]),
+            "height": int(stream["height"]),
+            "fps": fps,
+            "frame_count": int(nb_frames) if nb_frames.isdigit() else 0,
+        }
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Incomplete stream information for {video_path}: {e}")
+
+
+class FFmpegCapture:
+    """
+    A cv2.VideoCapture stand-in that decodes through an ffmpeg subprocess.
+
+    Frames are decoded by ffmpeg (using the requested hardware accelerator)
+    and streamed as raw BGR24 over a pipe.
+    """
+
+    def __init__(self, video_path: str, hwaccel: str) -> None:
+        """
+        Start decoding a video file through ffmpeg.
+
+        Args:
+            video_path (str): Path to the video file
+            hwaccel (str): Hardware decoder name, one of HWACCEL_OPTIONS
+
+        Raises:
+            ValueError: If the decoder is unknown or ffmpeg cannot decode the file
+        """
+        if hwaccel not in HWACCEL_OPTIONS:
+            raise ValueError(f"Unknown decoder: {hwaccel}")
+
+        self._ffmpeg = shutil.which("ffmpeg")
+        if self._ffmpeg is None:
+            raise ValueError("ffmpeg not found")
+
+        self.video_path = video_path
+        self.hwaccel = hwaccel
+        self._info = probe_video(video_path)
+        self._shape: Tuple[int, int, int] = (self._info["height"], self._info["width"], 3)
+        self._proc: Optional[subprocess.Popen] = None
+        # ffmpeg's error output, kept in a file so a chatty process can't block
+        self._stderr = None
+        # Reused destination for frames that are grabbed but never retrieved
+        self._skip_buf = np.empty(self._shape, dtype=np.uint8)
+        # First frame, decoded up front and handed out by the next read/grab
+        self._pending: Optional[np.ndarray] = None
+        self._position = 0
+        self._start(0)
+
+        # ffmpeg starts even when the hardware decoder cannot be set up and
+        # then exits without output, so decode the first frame before
+        # reporting success
+        frame = np.empty(self._shape, dtype=np.uint8)
+        if not self._read_into(memoryview(frame).cast("B")):
+            message = self._error_output()
+            self._stop_process()
+            raise ValueError(f"ffmpeg could not decode {video_path}: {message or 'no frames'}")
+        self._pending = frame
+
+    def _start(self, frame: int) -> None:
+        """
+        (Re)start the ffmpeg process at the given frame.
+
+        Args:
+            frame (int): Frame index to start decoding from
+
+        Raises:
+            ValueError: If seeking is requested but the frame rate is unknown
+        """
+        if frame > 0 and self._info["fps"] <= 0:
+            raise ValueError("Cannot seek: video frame rate is unknown")
+
+        self._stop_process()
+        self._pending = None
+
+        cmd = [self._ffmpeg, "-v", "error", "-nostdin"]
+        cmd += HWACCEL_OPTIONS[self.hwaccel]
+        if frame > 0:
+            cmd += ["-ss", f"{frame / self._info['fps']:.6f}"]
+        cmd += ["-i", self.video_path, "-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1"]
+
+        self._stderr = tempfile.TemporaryFile()
+        try:
+            self._proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=self._stderr, bufsize=0
+            )
+        except OSError as e:
+            self._stderr.close()
+            self._stderr = None
+            raise ValueError(f"Could not start ffmpeg: {e}")
+        self._position = frame
+
+    def _stop_process(self) -> None:
+        """Terminate the running ffmpeg process, if any."""
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.stdout.close()
+            self._proc.wait()
+            self._proc = None
+        if self._stderr is not None:
+            self._stderr.close()
+            self._stderr = None
+
+    def _error_output(self) -> str:
+        """
+        Wait for the ended ffmpeg process and return what it wrote to stderr.
+
+        Returns:
+            str: ffmpeg's error messages, stripped
+        """
+        self._proc.wait()
+        self._stderr.seek(0)
+        return self._stderr.read().decode(errors="replace").strip()
+
+    def _read_into(self, buffer: memoryview) -> bool:
+        """
+        Fill a buffer completely from the ffmpeg pipe.
+
+        Args:
+            buffer (memoryview): Writable byte view to fill
+
+        Returns:
+            bool: False if the stream ended before the buffer was filled
+        """
+        filled = 0
+        while filled < len(buffer):
+            count = self._proc.stdout.readinto(buffer[filled:])
+            if not count:
+                return False
+            filled += count
+        return True
+
+    def isOpened(self) -> bool:
+        """Return whether the ffmpeg process is available for reading."""
+        return self._proc is not None
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Read the next decoded frame.
+
+        Returns:
+            Tuple[bool, Optional[np.ndarray]]: Success flag and BGR frame
+        """
+        if self._pending is not None:
+            frame, self._pending = self._pending, None
+            self._position += 1
+            return True, frame
+        if self._proc is None:
+            return False, None
+
+        # Read straight into the frame's memory. Each frame gets its own array
+        # because frames are queued ahead of display and drawn on in place.
+        frame = np.empty(self._shape, dtype=np.uint8)
+        if not self._read_into(memoryview(frame).cast("B")):
+            return False, None
+
+        self._position += 1
+        return True, frame
+
+    def grab(self) -> bool:
+        """
+        Advance past the next frame without returning it.
+
+        Returns:
+            bool: False if the stream has ended
+        """
+        if self._pending is not None:
+            self._pending = None
+            self._position += 1
+            return True
+        if self._proc is None or not self._read_into(memoryview(self._skip_buf).cast("B")):
+            return False
+
+        self._position += 1
+        return True
+
+    def get(self, prop_id: int) -> float:
+        """
+        Get a capture property, mirroring cv2.VideoCapture.get.
+
+        Args:
+            prop_id (int): OpenCV capture property id
+
+        Returns:
+            float: Property value, or 0 if unsupported
+        """
+        if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return float(self._info["frame_count"])
+        if prop_id == cv2.CAP_PROP_FPS:
+            return self._info["fps"]
+        if prop_id == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self._info["width"])
+        if prop_id == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self._info["height"])
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            return float(self._position)
+        return 0.0
+
+    def set(self, prop_id: int, value: float) -> bool:
+        """
+        Set a capture property, mirroring cv2.VideoCapture.set.
+
+        Only seeking via CAP_PROP_POS_FRAMES is supported; it restarts ffmpeg
+        at the requested position.
+
+        Args:
+            prop_id (int): OpenCV capture property id
+            value (float): New property value
+
+        Returns:
+            bool: True if the property was applied
+
+        Raises:
+            ValueError: If seeking but the frame rate is unknown
+        """
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            self._start(int(value))
+            return True
+        return False
+
+    def release(self) -> None:
+        """Stop decoding and release the ffmpeg process."""
+        self._stop_process()
+        self._pending = None
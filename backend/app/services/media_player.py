@@ -5,11 +5,35 @@ This module provides a MediaPlayer class that handles video file loading,
 playback control, and frame display with timestamp overlays.
 """
 
+import os
+
+# Prefer the FFmpeg video I/O backend over platform defaults (MSMF on
+# Windows). OpenCV reads these only once, so they must be set before the
+# cv2 import below.
+os.environ.setdefault("OPENCV_VIDEOIO_PRIORITY_FFMPEG", "1000")
+os.environ.setdefault("OPENCV_VIDEOIO_PRIORITY_MSMF", "0")
+
 import cv2
+import numpy as np
+import queue
 import threading
 import time
 from typing import Optional, Dict, Any
 
+from app.config.settings import settings
+from ._overlay import (
+    TIMESTAMP_CHARS, blit_patches, compute_schedule, render_text_patches, timestamp_glyphs
+)
+from .display import display_pump
+from .ffmpeg_capture import FFmpegCapture
+
+# Cap OpenCV's internal thread pool so decoding doesn't oversubscribe the
+# cores shared with the API server's threadpool; null means half the cores
+_opencv_threads = settings.get("opencv", {}).get("threads")
+if _opencv_threads is None:
+    _opencv_threads = max(1, (os.cpu_count() or 2) // 2)
+cv2.setNumThreads(int(_opencv_threads))
+
 
 class MediaPlayer:
     """
@@ -17,23 +41,65 @@ class MediaPlayer:
 
     This class uses OpenCV to handle video files and provides functionality
     for playing, pausing, stopping, and controlling playback speed.
+
+    Importing this module configures OpenCV process-wide (video I/O backend
+    priorities and thread count), so it must be imported before any other
+    module imports cv2.
     """
 
     # Valid playback speeds supported by the player
     VALID_SPEEDS = [0.5, 1.0, 2.0, 4.0]
 
-    def __init__(self, video_path: str) -> None:
+    # FFmpeg capture options applied to RTSP sources to keep latency low
+    RTSP_CAPTURE_OPTIONS = "rtsp_transport;tcp|fflags;nobuffer|flags;low_delay"
+
+    # Shared text style for the timestamp and speed overlays
+    OVERLAY_FONT = cv2.FONT_HERSHEY_SIMPLEX
+    OVERLAY_SCALE = 1
+    OVERLAY_COLOR = (255, 255, 255)
+    OVERLAY_THICKNESS = 2
+
+    # Text origins (bottom-left of the text) of the overlays in the frame
+    TIMESTAMP_OVERLAY_POSITION = (10, 30)
+    SPEED_OVERLAY_POSITION = (10, 70)
+
+    # Timestamps from this many milliseconds on need three minute digits and
+    # are drawn with putText instead of the two-digit glyph layout
+    GLYPH_TIMESTAMP_LIMIT_MS = 100 * 60 * 1000
+
+    # Redraw the timestamp text only every N frames; finer updates are
+    # imperceptible at normal frame rates
+    TIMESTAMP_REFRESH_FRAMES = 3
+
+    # Number of decoded frames buffered between the decoder and display
+    # threads; kept small to bound memory and latency
+    FRAME_QUEUE_SIZE = 2
+
+    # When playback lags this many frame periods behind schedule, re-anchor
+    # the schedule instead of dropping more frames; dropping only skips the
+    # drawing, so it cannot catch up when decoding itself is too slow
+    MAX_LAG_PERIODS = 3
+
+    def __init__(self, video_path: str, decoder: str = "auto") -> None:
         """
         Initialize the MediaPlayer with a video file.
 
         Args:
             video_path (str): Path to the video file to be played
+            decoder (str): "auto" for OpenCV software decoding, or a hardware
+                decoder ("cuda", "vaapi") to decode through an ffmpeg process;
+                falls back to OpenCV if the hardware path is unavailable
 
         Raises:
             ValueError: If the video file cannot be opened
         """
         self.video_path = video_path
+        self.decoder = decoder
         self.cap = None
+        # Skip all drawing when no window is shown (headless deployments);
+        # with OpenCL available, overlays are drawn on the GPU via cv2.UMat
+        self._display = bool(settings.get("display", {}).get("enabled", True))
+        self._use_umat = self._display and cv2.ocl.haveOpenCL()
         self.is_playing = False
         self.is_paused = False
         self.current_frame = 0
@@ -41,7 +107,57 @@ class MediaPlayer:
         self.fps = 30.0
         self.speed = 1.0  # Default speed changed to 1x for better UX
         self.play_thread = None
+        # Decoder thread feeding (generation, frame, advance) items to the
+        # playback thread, where advance is the number of source frames the
+        # item covers
+        self._decoder_thread = None
+        self._frame_q: queue.Queue = queue.Queue(maxsize=self.FRAME_QUEUE_SIZE)
+        # Both worker threads live for the lifetime of the player and are
+        # driven by these events instead of being spawned on every play()
+        self._play_event = threading.Event()    # a playback session is active
+        self._decode_event = threading.Event()  # the decoder should read frames
+        self._stop_event = threading.Event()    # the player is shutting down
+        self._idle_event = threading.Event()    # no playback session is running
+        self._idle_event.set()
+        self._resume_event = threading.Event()  # playback is not paused
+        self._resume_event.set()
+        # Serializes session start/end against play() and stop()
+        self._state_lock = threading.Lock()
+        # Guards the capture; bumping _generation invalidates queued frames
+        self._cap_lock = threading.Lock()
+        self._generation = 0
+        # Wakes the scheduler early when speed or playback state changes
+        self._schedule_cond = threading.Condition()
+        # Pacing state: frame targets are computed as
+        # _schedule_start + (current_frame - _schedule_base) * period
+        self._schedule_start = 0.0
+        self._schedule_base = 0
+        # Pre-rendered speed text and its pixel mask, rebuilt on set_speed
+        self._speed_overlay: Optional[np.ndarray] = None
+        self._speed_overlay_mask: Optional[np.ndarray] = None
+        self._speed_overlay_origin = (0, 0)
+        self._speed_overlay_text = ""
+        # Pre-rendered timestamp characters, laid out per frame by glyph id
+        self._glyphs, self._glyph_masks, self._glyph_widths, glyph_height = render_text_patches(
+            TIMESTAMP_CHARS, self.OVERLAY_FONT, self.OVERLAY_SCALE,
+            self.OVERLAY_COLOR, self.OVERLAY_THICKNESS
+        )
+        self._glyph_top = self.TIMESTAMP_OVERLAY_POSITION[1] - glyph_height
+        # Last timestamp drawn onto a frame, as text and as glyph ids with
+        # their x offsets, and the frame it was computed for
+        self._overlay_timestamp = ""
+        self._overlay_glyphs = np.zeros(0, dtype=np.uint8)
+        self._overlay_glyph_offsets = np.zeros(0, dtype=np.int64)
+        self._overlay_timestamp_frame = -self.TIMESTAMP_REFRESH_FRAMES
+        # Timestamp formatting state: duration of one frame and the most
+        # recently formatted (frame, text) pair
+        self._ms_per_frame = 1000.0 / self.fps
+        self._timestamp_cache = (-1, "")
+        self._render_speed_overlay()
         self._load_video()
+        # Status dictionary reused across update_status() calls
+        self._status = self.get_status()
+        self._start_workers()
 
     def _load_video(self) -> None:
         """
@@ -53,16 +169,64 @@ class MediaPlayer:
         if self.cap:
             self.cap.release()
 
-        self.cap = cv2.VideoCapture(self.video_path)
+        if self.decoder != "auto":
+            try:
+                self.cap = FFmpegCapture(self.video_path, self.decoder)
+            except ValueError:
+                self.cap = None  # Fall back to OpenCV decoding
+
+        if self.cap:
+            self._read_properties()
+            return
+
+        # Request the FFmpeg backend explicitly so decoder selection does not
+        # depend on the platform's default backend ordering
+        if self.video_path.lower().startswith("rtsp://"):
+            # The options are read from the environment when the capture is
+            # opened; restore it so later file opens don't inherit them
+            previous = os.environ.get("OPENCV_FFMPEG_CAPTURE_OPTIONS")
+            os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = self.RTSP_CAPTURE_OPTIONS
+            try:
+                self.cap = cv2.VideoCapture(self.video_path, cv2.CAP_FFMPEG)
+            finally:
+                if previous is None:
+                    os.environ.pop("OPENCV_FFMPEG_CAPTURE_OPTIONS", None)
+                else:
+                    os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = previous
+        else:
+            self.cap = cv2.VideoCapture(self.video_path, cv2.CAP_FFMPEG)
         if not self.cap.isOpened():
             raise ValueError(f"Could not open video file: {self.video_path}")
 
+        # Keep at most one queued frame so live sources don't lag behind;
+        # not every backend supports this property
+        try:
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        except cv2.error:
+            pass
+
+        self._read_properties()
+
+    def _read_properties(self) -> None:
+        """Read frame count and frame rate from the opened capture."""
         self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
         self.fps = self.cap.get(cv2.CAP_PROP_FPS)
 
         if self.fps <= 0:
             self.fps = 30.0  # Fallback FPS if video doesn't provide it
 
+        self._ms_per_frame = 1000.0 / self.fps
+
+    def _start_workers(self) -> None:
+        """Start the long-lived decoder and playback threads."""
+        self._decoder_thread = threading.Thread(target=self._decode_frames)
+        self._decoder_thread.daemon = True
+        self._decoder_thread.start()
+
+        self.play_thread = threading.Thread(target=self._play_video)
+        self.play_thread.daemon = True
+        self.play_thread.start()
+
     def play(self, speed: Optional[float] = None) -> None:
         """
         Start or resume video playback.
@@ -73,34 +237,88 @@ class MediaPlayer:
         if speed is not None:
             self.set_speed(speed)
 
-        if not self.is_playing:
-            self.is_playing = True
-            self.is_paused = False
-            self.play_thread = threading.Thread(target=self._play_video)
-            self.play_thread.daemon = True
-            self.play_thread.start()
-        else:
-            self.is_paused = False
+        with self._state_lock:
+            if not self.is_playing:
+                self.is_playing = True
+                self.is_paused = False
+                self._resume_event.set()
+                self._idle_event.clear()
+                self._restart_decoder()
+                self._play_event.set()
+            else:
+                self.is_paused = False
+                self._resume_event.set()
 
     def pause(self) -> None:
         """Pause video playback if currently playing."""
         if self.is_playing:
             self.is_paused = True
+            self._resume_event.clear()
 
     def stop(self) -> None:
         """Stop video playback completely and close display windows."""
-        self.is_playing = False
-        self.is_paused = False
-        if self.play_thread:
-            self.play_thread.join()
-        cv2.destroyAllWindows()
+        with self._state_lock:
+            self.is_playing = False
+            self.is_paused = False
+            self._resume_event.set()
+        self._wake_scheduler()
+        self._idle_event.wait()
 
     def reset(self) -> None:
-        """Reset video to the beginning."""
+        """Reset video to the beginning without interrupting playback."""
+        self.seek(0)
+
+    def seek(self, frame: int) -> None:
+        """
+        Move playback to the given frame.
+
+        The worker threads, capture and display window are kept; frames the
+        decoder read ahead are discarded and playback continues from the new
+        position if it was running.
+
+        Args:
+            frame (int): Index of the frame to show next
+
+        Raises:
+            ValueError: If the frame is outside the video
+        """
+        if frame < 0 or (self.total_frames > 0 and frame >= self.total_frames):
+            raise ValueError(f"Invalid frame. Must be between 0 and {self.total_frames - 1}")
+
+        with self._cap_lock:
+            self._generation += 1
+            self._drain_frames()
+            if self.cap:
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame)
+            self.current_frame = frame
+            if self.is_playing:
+                # The decoder may have gone idle at the end of the video
+                self._decode_event.set()
+        self._reset_schedule()
+        self._wake_scheduler()
+
+    def close(self) -> None:
+        """
+        Stop playback, shut down the worker threads and release the video.
+
+        Resources are released here rather than in __del__: the worker threads
+        hold references to the player, so it is never garbage collected while
+        they run, and OpenCV GUI calls from the garbage collector can run on
+        arbitrary threads. Callers must close players they no longer need.
+        """
         self.stop()
-        self.current_frame = 0
-        if self.cap:
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self._stop_event.set()
+        self._play_event.set()
+        self._decode_event.set()
+        for thread in (self.play_thread, self._decoder_thread):
+            if thread and thread is not threading.current_thread():
+                thread.join()
+        with self._cap_lock:
+            if self.cap:
+                self.cap.release()
+                self.cap = None
+        if self._display:
+            display_pump.close_window()
 
     def set_speed(self, speed: float) -> None:
         """
@@ -114,66 +332,309 @@ class MediaPlayer:
         """
         if speed in self.VALID_SPEEDS:
             self.speed = speed
+            self._render_speed_overlay()
+            self._reset_schedule()
+            self._wake_scheduler()
         else:
             raise ValueError(f"Invalid speed. Must be one of: {self.VALID_SPEEDS}")
 
+    def _reset_schedule(self) -> None:
+        """Re-anchor the frame scheduler at the current frame and time."""
+        self._schedule_start = time.monotonic()
+        self._schedule_base = self.current_frame
+
+    def _wake_scheduler(self) -> None:
+        """Interrupt the playback thread if it is waiting for a frame deadline."""
+        with self._schedule_cond:
+            self._schedule_cond.notify_all()
+
+    def _restart_decoder(self) -> None:
+        """Discard buffered frames and let the decoder read for a new session."""
+        with self._cap_lock:
+            self._generation += 1
+            self._drain_frames()
+            self._decode_event.set()
+
+    def _halt_decoder(self, rewind: bool) -> None:
+        """
+        Stop the decoder and discard frames it read ahead.
+
+        Args:
+            rewind (bool): Seek the capture back to the first undisplayed frame
+        """
+        self._decode_event.clear()
+        with self._cap_lock:
+            self._generation += 1
+            self._drain_frames()
+            if rewind and self.cap:
+                try:
+                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame)
+                except ValueError:
+                    pass  # Capture can't seek; resume after the read-ahead
+
+    def _drain_frames(self) -> None:
+        """Empty the frame queue without blocking."""
+        try:
+            while True:
+                self._frame_q.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _put_frame(self, generation: int, frame, advance: int) -> None:
+        """
+        Queue a decoded frame for display, blocking while the queue is full.
+
+        Args:
+            generation (int): Decoder generation the frame was read in
+            frame: The decoded frame, or None to signal end of video
+            advance (int): Number of source frames consumed, including skipped ones
+        """
+        while self._decode_event.is_set() and generation == self._generation:
+            try:
+                self._frame_q.put((generation, frame, advance), timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _decode_frames(self) -> None:
+        """
+        Internal method that decodes frames in a separate thread.
+
+        Decoded frames are pushed into the bounded frame queue, whose blocking
+        put throttles decoding to the display rate. Each frame is tagged with
+        the decoder generation so frames read before a stop or seek can be
+        told apart and discarded. A None frame marks the end of the video,
+        after which the decoder idles until the next session.
+
+        At speeds above 1x only every Nth frame is shown, so the frames in
+        between are grabbed (demuxed and decoded) but never retrieved, which
+        skips their color conversion. Slower speeds need no extra decoding
+        since the scheduler simply holds each frame on screen for longer.
+        """
+        while True:
+            self._decode_event.wait()
+            if self._stop_event.is_set():
+                break
+
+            with self._cap_lock:
+                if not self._decode_event.is_set():
+                    continue
+                generation = self._generation
+                stride = max(1, int(round(self.speed)))
+                skipped = 0
+                while skipped < stride - 1 and self.cap.grab():
+                    skipped += 1
+                ret, frame = self.cap.read() if skipped == stride - 1 else (False, None)
+
+            if ret:
+                self._put_frame(generation, frame, stride)
+                continue
+
+            self._put_frame(generation, None, skipped)
+            with self._cap_lock:
+                # Idle until the next session unless one already started
+                if generation == self._generation:
+                    self._decode_event.clear()
+
     def _play_video(self) -> None:
         """
-        Internal method to handle video frame playback in a separate thread.
+        Internal method that runs playback sessions in a separate thread.
+
+        The thread waits until play() starts a session, runs it to completion
+        and then goes back to waiting, so repeated play/stop cycles reuse the
+        same thread.
+        """
+        while True:
+            self._play_event.wait()
+            if self._stop_event.is_set():
+                break
+            self._play_session()
 
-        This method runs in a loop while playing, reading frames from the video,
-        adding overlays, and displaying them at the correct timing.
+    def _play_session(self) -> None:
         """
-        while self.is_playing and self.cap and self.cap.isOpened():
-            if self.is_paused:
-                time.sleep(0.1)  # Short sleep while paused
+        Play frames from the decoder until stopped or the video ends.
+
+        This method runs in a loop while playing, taking decoded frames from
+        the decoder thread, adding overlays, and displaying them at the correct
+        timing. Frames are paced against a monotonic clock so per-frame
+        processing time does not accumulate as drift; when playback falls more
+        than one frame behind, the next frame is dropped without being drawn so
+        the schedule can catch up, and beyond MAX_LAG_PERIODS the schedule is
+        re-anchored so frames keep being drawn.
+        """
+        self._reset_schedule()
+        behind = False
+        ended = False
+        display_pump.clear_quit()
+
+        while self.is_playing and not self._stop_event.is_set():
+            if not self._resume_event.is_set():
+                # Block until resumed; the timeout keeps is_playing observed
+                self._resume_event.wait(timeout=1.0)
+                self._reset_schedule()
+                continue
+
+            period = 1.0 / (self.fps * self.speed)
+            try:
+                generation, frame, advance = self._frame_q.get(timeout=period)
+            except queue.Empty:
+                # Decoder fell behind; keep the last frame on screen and
+                # keep servicing the window until the next one arrives
+                if self._quit_requested():
+                    break
                 continue
 
-            ret, frame = self.cap.read()
-            if not ret:
+            if generation != self._generation:
+                continue
+
+            if frame is None:
                 # End of video reached
+                self.current_frame += advance
+                ended = True
                 break
 
-            # Add visual overlays to the frame
-            self._add_overlays(frame)
+            if self._display and not behind:
+                self._show_frame(frame)
+
+            if generation == self._generation:
+                self.current_frame += advance
+
+            # Wait until the next frame is due. The wait is interruptible so
+            # speed changes and stop() take effect immediately.
+            target, period = compute_schedule(
+                self.current_frame, self._schedule_base, self.fps, self.speed, self._schedule_start
+            )
+            delay = target - time.monotonic()
+            behind = delay < -period
+            if delay < -self.MAX_LAG_PERIODS * period:
+                # Too far behind to catch up; play on from here, slower
+                self._reset_schedule()
+                behind = False
+            if delay > 0:
+                with self._schedule_cond:
+                    self._schedule_cond.wait(timeout=delay)
+
+            if self._quit_requested():
+                break
 
-            # Display the frame
-            cv2.imshow('Video Player', frame)
+        with self._state_lock:
+            self.is_playing = False
+            self.is_paused = False
+            self._resume_event.set()
+            self._play_event.clear()
+            # Rewind past frames the decoder read ahead but never displayed
+            self._halt_decoder(rewind=not ended)
+            if self._display:
+                display_pump.close_window()
+            self._idle_event.set()
+
+    def _show_frame(self, frame) -> None:
+        """
+        Draw overlays on a frame and hand it to the display pump.
 
-            # Calculate and apply frame delay based on speed
-            frame_delay = (1.0 / self.fps) / self.speed
-            time.sleep(frame_delay)
+        Args:
+            frame: The decoded video frame
+        """
+        if self._use_umat:
+            frame = cv2.UMat(frame)
 
-            self.current_frame += 1
+        # Add visual overlays to the frame
+        self._add_overlays(frame)
 
-            # Check for quit command (ESC or 'q')
-            key = cv2.waitKey(1) & 0xFF
-            if key in [ord('q'), 27]:  # 'q' or ESC key
-                break
+        # Display the frame
+        display_pump.show(frame)
 
-        self.is_playing = False
-        cv2.destroyAllWindows()
+    def _quit_requested(self) -> bool:
+        """
+        Check whether a quit key was pressed in the display window.
+
+        Returns:
+            bool: True if ESC or 'q' was pressed
+        """
+        if not self._display:
+            return False
+        return display_pump.poll_quit()
+
+    def _render_speed_overlay(self) -> None:
+        """
+        Rasterize the speed text once into a small image strip.
+
+        The strip and a mask of its drawn pixels are cached so that
+        _add_overlays can copy them into each frame instead of calling
+        cv2.putText for text that only changes with set_speed.
+        """
+        text = f"Speed: {self.speed}x"
+        (width, height), baseline = cv2.getTextSize(
+            text, self.OVERLAY_FONT, self.OVERLAY_SCALE, self.OVERLAY_THICKNESS
+        )
+        strip = np.zeros((height + baseline + self.OVERLAY_THICKNESS, width, 3), dtype=np.uint8)
+        cv2.putText(
+            strip, text, (0, height),
+            self.OVERLAY_FONT, self.OVERLAY_SCALE, self.OVERLAY_COLOR,
+            self.OVERLAY_THICKNESS, cv2.LINE_AA
+        )
+        self._speed_overlay = strip
+        self._speed_overlay_mask = strip.any(axis=2)
+        x, y = self.SPEED_OVERLAY_POSITION
+        self._speed_overlay_origin = (x, y - height)
+        self._speed_overlay_text = text
 
     def _add_overlays(self, frame) -> None:
         """
         Add timestamp and speed overlays to the video frame.
 
         Args:
-            frame: The video frame to add overlays to
+            frame: The video frame to add overlays to (ndarray or cv2.UMat)
         """
-        # Add timestamp overlay (top-left)
-        timestamp = self._get_timestamp()
-        cv2.putText(
-            frame, timestamp, (10, 30),
-            cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2, cv2.LINE_AA
+        # Refresh every few frames, and at once after seeking backwards
+        frames_since = self.current_frame - self._overlay_timestamp_frame
+        if frames_since < 0 or frames_since >= self.TIMESTAMP_REFRESH_FRAMES:
+            self._refresh_overlay_timestamp()
+
+        if isinstance(frame, cv2.UMat) or not len(self._overlay_glyphs):
+            # Masked copies aren't available on UMat (let OpenCL draw the
+            # text), and the glyph layout only covers two-digit minutes
+            cv2.putText(
+                frame, self._overlay_timestamp, self.TIMESTAMP_OVERLAY_POSITION,
+                self.OVERLAY_FONT, self.OVERLAY_SCALE, self.OVERLAY_COLOR,
+                self.OVERLAY_THICKNESS, cv2.LINE_AA
+            )
+        else:
+            # Add timestamp overlay (top-left) from the glyph patches
+            blit_patches(
+                frame, self._glyphs, self._glyph_masks,
+                self._overlay_glyphs, self._overlay_glyph_offsets, self._glyph_top
+            )
+
+        if isinstance(frame, cv2.UMat):
+            cv2.putText(
+                frame, self._speed_overlay_text, self.SPEED_OVERLAY_POSITION,
+                self.OVERLAY_FONT, self.OVERLAY_SCALE, self.OVERLAY_COLOR,
+                self.OVERLAY_THICKNESS, cv2.LINE_AA
+            )
+            return
+
+        # Add speed overlay (below timestamp) from the cached strip
+        x, y = self._speed_overlay_origin
+        blit_patches(
+            frame, self._speed_overlay[np.newaxis], self._speed_overlay_mask[np.newaxis],
+            np.zeros(1, dtype=np.uint8), np.array([x], dtype=np.int64), y
         )
 
-        # Add speed overlay (below timestamp)
-        speed_text = f"Speed: {self.speed}x"
-        cv2.putText(
-            frame, speed_text, (10, 70),
-            cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2, cv2.LINE_AA
-        )
+    def _refresh_overlay_timestamp(self) -> None:
+        """Recompute the timestamp text and glyph layout for the current frame."""
+        frame = self.current_frame
+        self._overlay_timestamp = self._get_timestamp()
+        self._overlay_timestamp_frame = frame
+
+        if frame * self._ms_per_frame >= self.GLYPH_TIMESTAMP_LIMIT_MS:
+            self._overlay_glyphs = np.zeros(0, dtype=np.uint8)
+            return
+
+        glyphs = timestamp_glyphs(frame, self._ms_per_frame)
+        widths = self._glyph_widths[glyphs]
+        self._overlay_glyphs = glyphs
+        self._overlay_glyph_offsets = self.TIMESTAMP_OVERLAY_POSITION[0] + np.cumsum(widths) - widths
 
     def _get_timestamp(self) -> str:
         """
@@ -182,13 +643,19 @@ class MediaPlayer:
         Returns:
             str: Timestamp in MM:SS:mmm format
         """
-        if self.fps > 0:
-            current_time = self.current_frame / self.fps
-            minutes = int(current_time // 60)
-            seconds = int(current_time % 60)
-            milliseconds = int((current_time % 1) * 1000)
-            return f"{minutes:02d}:{seconds:02d}:{milliseconds:03d}"
-        return "00:00:000"
+        frame = self.current_frame
+        # Read and written as one tuple: the playback thread and /status
+        # polls call this concurrently
+        cached_frame, cached_text = self._timestamp_cache
+        if frame == cached_frame:
+            return cached_text
+
+        total_ms = int(frame * self._ms_per_frame)
+        seconds, milliseconds = divmod(total_ms, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        text = f"{minutes:02d}:{seconds:02d}:{milliseconds:03d}"
+        self._timestamp_cache = (frame, text)
+        return text
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -208,8 +675,20 @@ class MediaPlayer:
             "fps": self.fps
         }
 
-    def __del__(self) -> None:
-        """Cleanup resources when object is destroyed."""
-        if self.cap:
-            self.cap.release()
-        cv2.destroyAllWindows()
\ No newline at end of file
+    def update_status(self) -> Dict[str, Any]:
+        """
+        Get current player status, reusing the player's status dictionary.
+
+        Only the fields that change during playback are refreshed; the same
+        dictionary is returned on every call.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing player state information
+        """
+        status = self._status
+        status["is_playing"] = self.is_playing
+        status["is_paused"] = self.is_paused
+        status["current_frame"] = self.current_frame
+        status["speed"] = self.speed
+        status["timestamp"] = self._get_timestamp()
+        return status
\ No newline at end of file
@@ -1,12 +1,23 @@
 import os
+import threading
 from typing import Optional
 from fastapi import HTTPException
+from app.config.settings import settings
 from .media_player import MediaPlayer
 
+# Static response bodies, built once instead of per request
+_PAUSED_RESPONSE = {"message": "Video playback paused"}
+_STOPPED_RESPONSE = {"message": "Video playback stopped"}
+_RESET_RESPONSE = {"message": "Video reset to beginning"}
+_NOT_LOADED_STATUS = {"loaded": False}
+
 
 class VideoService:
     def __init__(self):
         self.media_player: Optional[MediaPlayer] = None
+        # Serializes state-changing calls coming from concurrent requests;
+        # taken on threadpool threads, so it is not tied to any event loop
+        self.lock = threading.Lock()
 
     def load_video(self, video_path: str) -> dict:
         """Load a video file"""
@@ -14,11 +25,24 @@ class VideoService:
             if not os.path.exists(video_path):
                 raise HTTPException(status_code=404, detail="Video file not found")
 
-            self.media_player = MediaPlayer(video_path)
+            # Open the new video before releasing the current one, so a file
+            # that fails to open leaves the loaded video in place
+            decoder = settings.get("video", {}).get("decoder", "auto")
+            player = MediaPlayer(video_path, decoder)
+            previous = self.media_player
+            self.media_player = player
+            if previous:
+                previous.close()
             return {"message": "Video loaded successfully", "path": video_path}
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
 
+    def close(self) -> None:
+        """Release the loaded video and its playback threads"""
+        player, self.media_player = self.media_player, None
+        if player:
+            player.close()
+
     def play_video(self, speed: Optional[float] = None) -> dict:
         """Play video with optional speed parameter"""
         if not self.media_player:
@@ -36,7 +60,7 @@ class VideoService:
             raise HTTPException(status_code=400, detail="No video loaded")
 
         self.media_player.pause()
-        return {"message": "Video playback paused"}
+        return _PAUSED_RESPONSE
 
     def stop_video(self) -> dict:
         """Stop video playback"""
@@ -44,7 +68,7 @@ class VideoService:
             raise HTTPException(status_code=400, detail="No video loaded")
 
         self.media_player.stop()
-        return {"message": "Video playback stopped"}
+        return _STOPPED_RESPONSE
 
     def reset_video(self) -> dict:
         """Reset video to beginning"""
@@ -52,7 +76,18 @@ class VideoService:
             raise HTTPException(status_code=400, detail="No video loaded")
 
         self.media_player.reset()
-        return {"message": "Video reset to beginning"}
+        return _RESET_RESPONSE
+
+    def seek_video(self, frame: int) -> dict:
+        """Seek video to a frame"""
+        if not self.media_player:
+            raise HTTPException(status_code=400, detail="No video loaded")
+
+        try:
+            self.media_player.seek(frame)
+            return {"message": f"Seeked to frame {frame}", "frame": frame}
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
     def set_speed(self, speed: float) -> dict:
         """Set playback speed"""
@@ -67,9 +102,13 @@ class VideoService:
 
     def get_status(self) -> dict:
         """Get current player status"""
-        if not self.media_player:
-            return {"loaded": False}
-
-        status = self.media_player.get_status()
+        # Read once: load_video() and close() may replace media_player from
+        # a threadpool thread
+        player = self.media_player
+        if not player:
+            return _NOT_LOADED_STATUS
+
+        # The player reuses its status dict across polls
+        status = player.update_status()
         status["loaded"] = True
         return status
\ No newline at end of file
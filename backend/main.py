@@ -1,20 +1,45 @@
+import threading
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
-from app.routes.video import router as video_router
+from app.routes.video import router as video_router, video_service
 from app.config.settings import settings
+from app.services.display import display_pump
+
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release the loaded video when the server shuts down"""
+    yield
+    video_service.close()
 
-app = FastAPI(title="Video Player API", version="1.0.0")
 
-# Enable CORS for frontend communication
+app = FastAPI(
+    title="Video Player API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# Enable CORS for frontend communication. Explicit lists let Starlette match
+# by set membership, and max_age lets browsers cache preflight responses.
+frontend = settings.get("frontend", {})
+frontend_port = frontend.get("port", 3000)
+default_origins = [
+    f"http://{frontend.get('host', 'localhost')}:{frontend_port}",
+    f"http://localhost:{frontend_port}",
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.get("cors", {}).get("origins", default_origins),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type"],
+    max_age=86400,
 )
 
 app.include_router(video_router)
@@ -24,4 +49,26 @@ app.include_router(video_router)
 if __name__ == "__main__":
     host = settings.get("backend", {}).get("host", "0.0.0.0")
     port = settings.get("backend", {}).get("port", 8000)
-    uvicorn.run(app, host=host, port=port)
\ No newline at end of file
+
+    if not settings.get("display", {}).get("enabled", True):
+        uvicorn.run(app, host=host, port=port)
+    else:
+        # OpenCV GUI calls must happen on the main thread, so serve the API
+        # from a secondary thread and run the display loop here
+        server = uvicorn.Server(uvicorn.Config(app, host=host, port=port))
+
+        def serve() -> None:
+            try:
+                server.run()
+            finally:
+                display_pump.stop()
+
+        server_thread = threading.Thread(target=serve)
+        server_thread.start()
+        try:
+            display_pump.run()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.should_exit = True
+            server_thread.join()
\ No newline at end of file